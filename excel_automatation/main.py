@@ -1,151 +1,110 @@
-import xlsxwriter
-
-# Crear un nuevo archivo Excel y agregar una hoja
-workbook = xlsxwriter.Workbook('./generated_files/comisiones.xlsx')
-worksheet = workbook.add_worksheet()
-
-# Definir los encabezados de la tabla
-headers = ['Vendedor', 'Ventas', 'Porcentaje de Comisión', 'Comisión Total']
-worksheet.write_row('A1', headers)
-
-# Datos de prueba
-vendedores = ['Juan', 'María', 'Pedro']
-ventas = [1000, 1500, 800]
-porcentaje_comision = 0.05  # 5%
-
-# Escribir los datos en las celdas
-for i in range(len(vendedores)):
-    worksheet.write(i + 1, 0, vendedores[i])  # Columna A
-    worksheet.write(i + 1, 1, ventas[i])       # Columna B
-
-# Escribir el porcentaje de comisión en C1
-worksheet.write('C1', porcentaje_comision)
-
-# Calcular la Comisión Total en la columna D
-for i in range(len(vendedores)):
-    worksheet.write_formula(i + 1, 3, f'B{i + 2}*C$1')  # Columna D
-
-# Cerrar el archivo
-workbook.close()
-
-
-#* Archivo 2
-
-# Crear un nuevo archivo Excel y agregar una hoja
-workbook = xlsxwriter.Workbook('./generated_files/productos.xlsx')
-worksheet = workbook.add_worksheet()
-
-# Definir los encabezados de la tabla
-headers = ['Producto', 'Precio Original', 'Descuento (%)', 'Precio Final']
-worksheet.write_row('A1', headers)
-
-# Datos de prueba
-productos = ['Producto A', 'Producto B', 'Producto C']
-precios_originales = [100, 250, 180]
-descuento = 0.10  # 10%
-
-# Escribir los datos en las celdas
-for i in range(len(productos)):
-    worksheet.write(i + 1, 0, productos[i])  # Columna A
-    worksheet.write(i + 1, 1, precios_originales[i])  # Columna B
-
-# Escribir el descuento en C1
-worksheet.write('C1', descuento)
-
-# Calcular el Precio Final en la columna D
-for i in range(len(productos)):
-    worksheet.write_formula(i + 1, 3, f'B{i + 2}*(1-C$1)')  # Columna D
-
-# Cerrar el archivo
-workbook.close()
-
-
-#*Archivo 3:
-
-# Crear un nuevo archivo Excel y agregar una hoja
-workbook = xlsxwriter.Workbook('./generated_files/costos_impuestos.xlsx')
-worksheet = workbook.add_worksheet()
-
-# Definir los encabezados de la tabla
-worksheet.write('A1', 'Costo')
-worksheet.write('B1', 'Impuesto')
-worksheet.write('C1', 'Costo total')
-
-# Escribir un costo de producto y un valor de impuesto
-worksheet.write('A2', 100)  # Costo del producto
-worksheet.write('B2', 0.18)   # Impuesto (18%)
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
-# Escribir la fórmula en C2
-worksheet.write_formula('C2', '=A2 + (A2 * $B$2)')
-
-# Cerrar el archivo
-workbook.close()
-
-
-#*Archivo 4
-
-# Crear un nuevo archivo Excel y agregar una hoja
-workbook = xlsxwriter.Workbook('./generated_files/bonificaciones_empleados.xlsx')
-worksheet = workbook.add_worksheet()
-
-# Definir los encabezados de la tabla
-worksheet.write('A1', 'Empleado')
-worksheet.write('A2', 'Salario Base')
-worksheet.write('A3', 'Porcentaje de Bonificación')
-
-# Nombres de empleados
-empleados = ['Empleado 1', 'Empleado 2', 'Empleado 3']
-salarios = [3000, 4500, 5000]
-
-# Escribir nombres de empleados en A4, A5, A6
-for i in range(len(empleados)):
-    worksheet.write(i + 3, 0, empleados[i])  # Columna A (A4, A5, A6)
-    worksheet.write(i + 3, 1, salarios[i])    # Columna B (B4, B5, B6)
-
-# Escribir el porcentaje de bonificación en C2
-worksheet.write('C2', 0.10)  # 10%
-
-# Definir encabezado para Bonificación
-worksheet.write('D1', 'Bonificación')
-
-# Escribir la fórmula en D4 para calcular la bonificación
-worksheet.write_formula('D4', '=B4*$C$2')
-
-# Copiar la fórmula hacia abajo
-worksheet.write_formula('D5', '=B5*$C$2')
-worksheet.write_formula('D6', '=B6*$C$2')
-
-# Cerrar el archivo
-workbook.close()
-
-
-#* Archivo 5
-
-# Crear un nuevo archivo Excel y agregar una hoja
-workbook = xlsxwriter.Workbook('./generated_files/gastos_presupuesto.xlsx')
-worksheet = workbook.add_worksheet()
-
-# Definir los encabezados de la tabla
-worksheet.write('A1', 'Categoría')
-worksheet.write('B1', 'Gasto Mensual')
-worksheet.write('C1', 'Presupuesto Anual')
-worksheet.write('D1', 'Porcentaje del Presupuesto')
-
-# Datos de prueba
-categorias = ['Comida', 'Transporte']
-gastos_mensuales = [300, 150]
-
-# Escribir los datos en las celdas
-for i in range(len(categorias)):
-    worksheet.write(i + 1, 0, categorias[i])  # Columna A (A2, A3)
-    worksheet.write(i + 1, 1, gastos_mensuales[i])  # Columna B (B2, B3)
-
-# Escribir el presupuesto anual en C1
-worksheet.write('C1', 6000)  # Presupuesto Anual
-
-# Calcular el Porcentaje del Presupuesto en D2
-worksheet.write_formula('D2', '=B2*12/C$1')
-worksheet.write_formula('D3', '=B3*12/C$1')
+import xlsxwriter
 
-# Cerrar el archivo
-workbook.close()
\ No newline at end of file
+# Opciones comunes: constant_memory escribe cada fila al disco al momento,
+# asi el uso de memoria no crece con la cantidad de filas.
+OPCIONES_WORKBOOK = {'constant_memory': True, 'strings_to_formulas': False}
+
+# Cada spec describe un archivo: encabezados, celdas sueltas (en orden de
+# fila por constant_memory), columnas de datos y la columna de fórmulas.
+SPECS = [
+    {
+        'path': './generated_files/comisiones.xlsx',
+        'headers': ['Vendedor', 'Ventas', 'Porcentaje de Comisión', 'Comisión Total'],
+        'cells': [('C1', 0.05)],  # Porcentaje de comisión: 5%
+        'columns': [
+            ['Juan', 'María', 'Pedro'],   # Vendedores
+            [1000, 1500, 800],            # Ventas
+        ],
+        'formula_col': 3,
+        'formula': 'B{fila}*C$1',
+    },
+    {
+        'path': './generated_files/productos.xlsx',
+        'headers': ['Producto', 'Precio Original', 'Descuento (%)', 'Precio Final'],
+        'cells': [('C1', 0.10)],  # Descuento: 10%
+        'columns': [
+            ['Producto A', 'Producto B', 'Producto C'],
+            [100, 250, 180],              # Precios originales
+        ],
+        'formula_col': 3,
+        'formula': 'B{fila}*(1-C$1)',
+    },
+    {
+        'path': './generated_files/costos_impuestos.xlsx',
+        'headers': ['Costo', 'Impuesto', 'Costo total'],
+        'columns': [
+            [100],   # Costo del producto
+            [0.18],  # Impuesto (18%)
+        ],
+        'formula_col': 2,
+        'formula': '=A{fila} + (A{fila} * $B$2)',
+    },
+    {
+        'path': './generated_files/bonificaciones_empleados.xlsx',
+        'cells': [
+            ('A1', 'Empleado'),
+            ('D1', 'Bonificación'),
+            ('A2', 'Salario Base'),
+            ('C2', 0.10),  # Porcentaje de bonificación: 10%
+            ('A3', 'Porcentaje de Bonificación'),
+        ],
+        'columns': [
+            ['Empleado 1', 'Empleado 2', 'Empleado 3'],
+            [3000, 4500, 5000],           # Salarios
+        ],
+        'fila_inicial': 3,
+        'formula_col': 3,
+        'formula': '=B{fila}*$C$2',
+    },
+    {
+        'path': './generated_files/gastos_presupuesto.xlsx',
+        'headers': ['Categoría', 'Gasto Mensual', 'Presupuesto Anual', 'Porcentaje del Presupuesto'],
+        'cells': [('C1', 6000)],  # Presupuesto Anual
+        'columns': [
+            ['Comida', 'Transporte'],
+            [300, 150],                   # Gastos mensuales
+        ],
+        'formula_col': 3,
+        'formula': '=B{fila}*12/C$1',
+    },
+]
+
+
+def build_sheet(spec):
+    """Genera un archivo Excel a partir de su spec."""
+
+    workbook = xlsxwriter.Workbook(spec['path'], OPCIONES_WORKBOOK)
+    worksheet = workbook.add_worksheet()
+
+    # Encabezados de la tabla
+    if 'headers' in spec:
+        worksheet.write_row('A1', spec['headers'])
+
+    # Celdas sueltas (escalares y etiquetas)
+    for celda, valor in spec.get('cells', []):
+        worksheet.write(celda, valor)
+
+    # Datos y fórmulas fila por fila
+    fila_inicial = spec.get('fila_inicial', 1)
+    for i, fila in enumerate(zip(*spec['columns'])):
+        numero_fila = fila_inicial + i
+        worksheet.write_row(numero_fila, 0, fila)
+        worksheet.write_formula(numero_fila, spec['formula_col'],
+                                spec['formula'].format(fila=numero_fila + 1))
+
+    # Cerrar el archivo
+    workbook.close()
+
+
+# Cada archivo es independiente, asi que los generamos en paralelo:
+# el armado del XML y el zip en workbook.close() es trabajo de CPU.
+if __name__ == '__main__':
+    # Asegurar la carpeta de salida antes de generar nada; si falta,
+    # workbook.close() fallaria recien despues de construir todo.
+    Path('./generated_files').mkdir(exist_ok=True)
+    with ProcessPoolExecutor(max_workers=min(len(SPECS), os.cpu_count() or 1)) as executor:
+        list(executor.map(build_sheet, SPECS))
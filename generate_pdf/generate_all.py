@@ -0,0 +1,15 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from Technical_CV import create_technical_report
+from generate_cpp_PDF import create_calendar_report
+
+# The two reports are independent and fpdf drawing is CPU-bound pure
+# Python, so build them in separate processes.
+if __name__ == '__main__':
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(create_technical_report),
+            executor.submit(create_calendar_report),
+        ]
+        for future in futures:
+            print(f'PDF report generated successfully: {future.result()}')
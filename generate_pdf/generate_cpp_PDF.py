@@ -1,26 +1,4 @@
-
-# Crear una clase que herede de FPDF
-class PDF(FPDF):
-    def header(self):
-        # Establecer fuente
-        self.set_font('Arial', 'B', 12)
-        # Título
-        self.cell(0, 10, 'Estructura del Programa de Calendario en C++', 0, 1, 'C')
-
-    def footer(self):
-        # Posicionar a 1.5 cm del final
-        self.set_y(-15)
-        # Establecer fuente
-        self.set_font('Arial', 'I', 8)
-        # Número de página
-        self.cell(0, 10, f'Página {self.page_no()}', 0, 0, 'C')
-
-# Crear un objeto PDF
-pdf = PDF()
-pdf.add_page()
-
-# Establecer fuente
-pdf.set_font('Arial', '', 12)
+from pdf_base import ReportPDF
 
 # Contenido del PDF
 content = [
@@ -156,10 +134,23 @@ content = [
     "Al final, el usuario puede ver el calendario del año que ingresó, con los días correctamente alineados según el día de la semana."
 ]
 
-# Agregar contenido al PDF
-for line in content:
-    pdf.multi_cell(0, 10, line)
+def create_calendar_report(filename='estructura_calendario.pdf'):
+    # Crear un objeto PDF (la clase compartida trae encabezado y pie de pagina)
+    pdf = ReportPDF('Estructura del Programa de Calendario en C++', footer_label='Página')
+    pdf.add_page()
+
+    # Establecer fuente
+    pdf.set_font('Arial', '', 12)
+
+    # Agregar contenido al PDF
+    for line in content:
+        pdf.multi_cell(0, 10, line)
+
+    # Guardar el PDF
+    pdf.output(filename)
+    return filename
+
 
-# Guardar el PDF
-pdf.output('estructura_calendario.pdf')
+if __name__ == '__main__':
+    create_calendar_report()
 
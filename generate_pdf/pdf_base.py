@@ -0,0 +1,101 @@
+import sys
+from pathlib import Path
+
+from fpdf import FPDF
+
+# Interned font names: set_font resolves fonts through dict lookups, and
+# passing the same interned object every call lets those hit the identity
+# fast path instead of comparing characters.
+_ARIAL = sys.intern('Arial')
+_BOLD = sys.intern('B')
+_ITALIC = sys.intern('I')
+_REGULAR = sys.intern('')
+
+
+class ReportPDF(FPDF):
+    """Shared FPDF subclass for the report scripts in this folder.
+
+    Carries the bytearray document buffer, the cached font/fill state
+    and the common header/footer, parameterized by the header text.
+    """
+
+    def __init__(self, header_text, footer_label='Page', header_spacing=0, **kwargs):
+        super().__init__(**kwargs)
+        self.header_text = header_text
+        self.footer_label = footer_label
+        self.header_spacing = header_spacing
+        # PyFPDF 1.7.2 accumulates the whole document in a str, so every
+        # _out call copies the buffer again. Collect bytes in a bytearray
+        # instead (latin-1, one byte per char, keeps xref offsets valid).
+        self.buffer = bytearray()
+        self._fill_rgb = None
+        # Page content operators are collected per page and joined once
+        # at page end; the base class appends each one to a str, which
+        # re-copies the page content on every drawing operation.
+        self._page_ops = {}
+
+    def _out(self, s):
+        if isinstance(s, bytes):
+            s = s.decode('latin1')
+        elif not isinstance(s, str):
+            s = str(s)
+        if self.state == 2:
+            self._page_ops.setdefault(self.page, []).append(s)
+        else:
+            self.buffer += s.encode('latin1') + b'\n'
+
+    def _endpage(self):
+        ops = self._page_ops.pop(self.page, None)
+        if ops:
+            ops.append('')
+            self.pages[self.page] += '\n'.join(ops)
+        super()._endpage()
+
+    def output(self, name='', dest=''):
+        if self.state < 3:
+            self.close()
+        # The document is already complete in memory, so hand the whole
+        # buffer to the OS in one write instead of going through a
+        # buffered file object held open across serialization.
+        data = bytes(self.buffer)
+        if dest == 'S':
+            return data
+        Path(name).write_bytes(data)
+        return ''
+
+    def _use_font(self, family, style, size):
+        # Mirror set_font's own short-circuit check (family is cleared on
+        # every new page, so page breaks still re-emit the font select).
+        if (family, style, size) != (self.font_family, self.font_style, self.font_size_pt):
+            self.set_font(family, style, size)
+
+    def _use_fill(self, rgb):
+        # add_page re-emits the stored fill color itself, so once set we
+        # only need a new command when the color actually changes.
+        if rgb != self._fill_rgb:
+            self.set_fill_color(*rgb)
+            self._fill_rgb = rgb
+
+    def header(self):
+        self.set_font(_ARIAL, _BOLD, 12)
+        self.cell(0, 10, self.header_text, 0, 1, 'C')
+        if self.header_spacing:
+            self.ln(self.header_spacing)
+
+    def footer(self):
+        self.set_y(-15)
+        self.set_font(_ARIAL, _ITALIC, 8)
+        self.cell(0, 10, f'{self.footer_label} {self.page_no()}', 0, 0, 'C')
+
+    def chapter_title(self, title):
+        self._use_font(_ARIAL, _BOLD, 14)
+        self._use_fill((200, 220, 255))
+        self.cell(0, 10, title, 0, 1, 'L', True)
+        self.ln(5)
+
+    def chapter_body(self, text):
+        self._use_font(_ARIAL, _REGULAR, 11)
+        # One multi_cell for the whole block: fpdf wraps it against the
+        # actual font metrics in a single pass.
+        self.multi_cell(0, 6, text)
+        self.ln(5)